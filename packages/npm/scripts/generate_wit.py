@@ -107,9 +107,10 @@ class WitGenerator:
 
                 py_call_args.append(param.name)
 
-            # Return type
+            # Return type (functions annotated "-> None" have no WIT result)
+            returns_none = str(member.returns) == "None"
             ret_type = "string"  # default
-            if member.returns:
+            if member.returns and not returns_none:
                 rt = str(member.returns)
                 wit_ret, _ = self.map_type(rt)
                 ret_type = wit_ret
@@ -117,8 +118,9 @@ class WitGenerator:
             # WIT Export
             wit_params_str = ", ".join(wit_params)
             wit_name = name.replace("_", "-")
+            wit_result = "" if returns_none else f" -> {ret_type}"
             self.world_exports.append(
-                f"export {wit_name}: func({wit_params_str}) -> {ret_type};"
+                f"export {wit_name}: func({wit_params_str}){wit_result};"
             )
 
             # Store for TS Wrapper
@@ -180,7 +182,7 @@ class WitGenerator:
                 method_body += f"        if {p.name} is not None: kwargs['{p.name}'] = {val_expr}\n"
 
             # Determine converter for return
-            if member.returns:
+            if member.returns and not returns_none:
                 _, adapter_tmpl = self.map_type(str(member.returns))
                 # adapter expects the value expression
                 final_expr = adapter_tmpl.replace("__FIELD__", call_expr)
@@ -130,9 +130,9 @@ def scan_module_for_functions(module, known_models: set[str]) -> list[dict[str,
                 "has_default": has_default,
             })
 
-        # Return type
+        # Return type (None for functions annotated "-> None": no WIT result)
         ret_type = None
-        if member.returns:
+        if member.returns and str(member.returns) != "None":
             ret_py = str(member.returns)
             ret_wit, ret_adapter = map_python_to_wit(ret_py, known_models)
             ret_type = {
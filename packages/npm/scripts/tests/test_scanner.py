@@ -155,6 +155,19 @@ class TestScanModuleForFunctions:
         result = scan_module_for_functions(module, set())
         assert len(result) == 0
 
+    def test_none_return_has_no_result_type(self):
+        module = MockModule(
+            "test.parsing",
+            {
+                "clear_parse_cache": MockMember(
+                    "clear_parse_cache", is_function=True, returns="None"
+                ),
+            },
+        )
+        result = scan_module_for_functions(module, set())
+        assert len(result) == 1
+        assert result[0]["return_type"] is None
+
 
 class TestScanClassMethods:
     def test_extracts_class_methods(self):
@@ -90,6 +90,14 @@ def get_typescript_api(ts_file: Path) -> Set[str]:
                 if method_name != "constructor":
                     found_api.add(f"{current_class}.{method_name}")
 
+        # Detect standalone wrapper functions emitted by index.ts.jinja2
+        # (export function parseTable(...) / export async function ...)
+        m_func = re.match(r"^export (?:async )?function (\w+)\(", line)
+        if m_func:
+            current_class = None
+            found_api.add(f"function {m_func.group(1)}")
+            continue
+
         # Detect Re-exported Function (from imports)
         # export { parseWorkbook };
         # Actually in index.ts we generate:
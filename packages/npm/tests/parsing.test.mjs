@@ -1,12 +1,13 @@
 /**
  * Parsing Function Tests for md-spreadsheet-parser NPM Package
  * 
- * Tests parseTable, parseWorkbook, parseSheet, scanTables functions.
+ * Tests parseTable, parseWorkbook, parseSheet, scanTables, clearParseCache functions.
  * Verifies correct structure and metadata type safety.
  */
 
 import {
     parseWorkbook,
+    clearParseCache,
     parseTable,
     parseSheet,
     scanTables,
@@ -129,6 +130,24 @@ export async function runParsingTests() {
         console.error("   ❌ parseWorkbook failed:", e);
     }
 
+    // ============================================================
+    // clearParseCache
+    // ============================================================
+
+    try {
+        const before = new Workbook(parseWorkbook(simpleWorkbookMd));
+        const res = clearParseCache();
+        assert(res === undefined, "clearParseCache should not return a value");
+
+        // Parsing again after clearing gives the same result
+        const after = new Workbook(parseWorkbook(simpleWorkbookMd));
+        assert(after.sheets.length === before.sheets.length, "Sheet count should match");
+
+        console.log("   ✅ clearParseCache verified");
+    } catch (e) {
+        console.error("   ❌ clearParseCache failed:", e);
+    }
+
     // ============================================================
     // scanTables
     // ============================================================
@@ -1,4 +1,5 @@
 from .parsing import (
+    clear_parse_cache,
     parse_table,
     parse_sheet,
     parse_workbook,
@@ -36,6 +37,7 @@ from .excel import (
 )
 
 __all__ = [
+    "clear_parse_cache",
     "parse_table",
     "parse_sheet",
     "parse_workbook",
@@ -1,11 +1,60 @@
 import argparse
 import json
+import math
 import sys
 from pathlib import Path
+from typing import Any
 
 from .parsing import parse_workbook, scan_tables
 from .schemas import MultiTableParsingSchema
 
+# --- Optional orjson support (faster JSON output) ---
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+
+def _orjson_compatible(data: Any) -> bool:
+    """
+    Whether orjson writes the CLI output exactly as json.dumps would.
+
+    orjson writes NaN/Infinity as null and formats exponents differently
+    (1e-7 vs 1e-07), so data holding such floats is left to the stdlib.
+    The output is a Workbook or a list of Tables in JSON form, whose headers
+    and cells are strings, so only the metadata is scanned.
+    """
+    if isinstance(data, list):
+        parts = data
+    else:
+        sheets = data.get("sheets", [])
+        parts = [data, *sheets, *(t for s in sheets for t in s.get("tables", []))]
+    stack = [part.get("metadata") for part in parts]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item) or "e" in repr(item):
+                return False
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return True
+
+
+def _dumps(data: Any) -> str:
+    """Serialize output as indented JSON, using orjson when it is installed."""
+    if HAS_ORJSON and _orjson_compatible(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -115,10 +164,10 @@ def main():
         if args.scan:
             tables = scan_tables(content, schema)
             # Output list of tables
-            print(json.dumps([t.json for t in tables], indent=2, ensure_ascii=False))
+            print(_dumps([t.json for t in tables]))
         else:
             workbook = parse_workbook(content, schema)
-            print(json.dumps(workbook.json, indent=2, ensure_ascii=False))
+            print(_dumps(workbook.json))
     except Exception as e:
         print(f"Error parsing content: {e}", file=sys.stderr)
         sys.exit(1)
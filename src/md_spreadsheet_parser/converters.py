@@ -11,13 +11,16 @@ except ImportError:
     # User env is 3.12.12. ZoneInfo is standard.
     from zoneinfo import ZoneInfo
 
+# Currency symbols and grouping separators removed by to_decimal_clean
+_DECIMAL_NOISE_RE = re.compile(r"[ $¥€£,_]")
+
 
 def to_decimal_clean(value: str) -> Decimal:
     """
     Convert a string to Decimal, removing common currency symbols and grouping separators.
     Removes: '$', '¥', '€', '£', ',', ' ' (space), '_'
     """
-    clean_val = re.sub(r"[ $¥€£,_]", "", value)
+    clean_val = _DECIMAL_NOISE_RE.sub("", value)
     if not clean_val:
         # What should empty string be?
         # Usually schema validation handles empty string via Optional[Decimal] -> None.
@@ -2,7 +2,7 @@ import json
 from typing import TYPE_CHECKING
 
 from .schemas import DEFAULT_SCHEMA, MultiTableParsingSchema, ParsingSchema
-from .yaml_parser import generate_yaml_frontmatter
+from .yaml_parser import frontmatter_unchanged, generate_yaml_frontmatter
 
 if TYPE_CHECKING:
     from .models import Sheet, Table, Workbook
@@ -21,6 +21,11 @@ def generate_table_markdown(
     Returns:
         str: The Markdown string.
     """
+    return "\n".join(_table_lines(table, schema))
+
+
+def _table_lines(table: "Table", schema: ParsingSchema) -> list[str]:
+    """Lines of generate_table_markdown, for callers that join once at the end."""
     lines = []
 
     # Handle metadata (name and description) if MultiTableParsingSchema
@@ -37,31 +42,34 @@ def generate_table_markdown(
     # Build table
 
     pipe = schema.column_separator or "|"
-
-    def _prepare_cell(cell: str) -> str:
-        """Prepare cell for markdown generation."""
-        if schema.convert_br_to_newline and "\n" in cell:
-            return cell.replace("\n", "<br>")
-        return cell
-
-    def _format_cell(cell: str) -> str:
-        """Format cell with surrounding spaces. Empty cells get single space."""
-        if cell:
-            return f" {cell} "
-        return " "
-
-    def _build_row(cells: list[str]) -> str:
-        """Build a pipe-delimited row from formatted cells."""
-        formatted = [_format_cell(c) for c in cells]
-        row_str = pipe.join(formatted)
-        if schema.require_outer_pipes:
+    convert_br = schema.convert_br_to_newline
+    outer_pipes = schema.require_outer_pipes
+    padded_pipe = f" {pipe} "
+
+    def _build_row(cells: list[str], prepare: bool = True) -> str:
+        """
+        Build a pipe-delimited row in one pass: newlines become <br> (when
+        prepare is set and the schema converts them), and each cell gets
+        surrounding spaces (empty cells a single space).
+        """
+        if prepare and convert_br:
+            cells = [c.replace("\n", "<br>") for c in cells]
+        row_str = None
+        if cells and all(cells):
+            # No empty cell: the whole row is a single join
+            try:
+                row_str = f" {padded_pipe.join(cells)} "
+            except TypeError:
+                pass  # non-str cells; the f-strings below stringify them
+        if row_str is None:
+            row_str = pipe.join([f" {c} " if c else " " for c in cells])
+        if outer_pipes:
             row_str = f"{pipe}{row_str}{pipe}"
         return row_str
 
     # Headers
     if table.headers:
-        processed_headers = [_prepare_cell(h) for h in table.headers]
-        lines.append(_build_row(processed_headers))
+        lines.append(_build_row(table.headers))
 
         # Separator row
         separator_cells = []
@@ -86,12 +94,10 @@ def generate_table_markdown(
 
             separator_cells.append(cell)
 
-        lines.append(_build_row(separator_cells))
+        lines.append(_build_row(separator_cells, prepare=False))
 
     # Rows
-    for row in table.rows:
-        processed_row = [_prepare_cell(cell) for cell in row]
-        lines.append(_build_row(processed_row))
+    lines.extend([_build_row(row) for row in table.rows])
 
     # Append Metadata if present
     if table.metadata and "visual" in table.metadata:
@@ -100,7 +106,7 @@ def generate_table_markdown(
         lines.append("")
         lines.append(comment)
 
-    return "\n".join(lines)
+    return lines
 
 
 def generate_sheet_markdown(
@@ -119,6 +125,11 @@ def generate_sheet_markdown(
     Returns:
         str: The Markdown string.
     """
+    return "\n".join(_sheet_lines(sheet, schema))
+
+
+def _sheet_lines(sheet: "Sheet", schema: ParsingSchema) -> list[str]:
+    """Lines of generate_sheet_markdown, for callers that join once at the end."""
     lines = []
 
     if isinstance(schema, MultiTableParsingSchema):
@@ -132,7 +143,8 @@ def generate_sheet_markdown(
     else:
         # Table sheet: output tables
         for i, table in enumerate(sheet.tables):
-            lines.append(generate_table_markdown(table, schema))
+            # An empty table still occupies one (blank) line
+            lines.extend(_table_lines(table, schema) or [""])
             if i < len(sheet.tables) - 1:
                 lines.append("")  # Empty line between tables
 
@@ -143,7 +155,7 @@ def generate_sheet_markdown(
         comment = f"<!-- md-spreadsheet-sheet-metadata: {metadata_json} -->"
         lines.append(comment)
 
-    return "\n".join(lines)
+    return lines
 
 
 # Keys in workbook.metadata that are used for round-trip control
@@ -151,6 +163,20 @@ def generate_sheet_markdown(
 _METADATA_INTERNAL_KEYS = {"header_type", "frontmatter"}
 
 
+def _frontmatter_block(metadata: dict, source: str | None) -> str:
+    """
+    The frontmatter block for a workbook whose root is its frontmatter.
+
+    The source text is reused as long as it still parses to the current
+    frontmatter data, so untouched frontmatter keeps its comments and
+    formatting and is not re-serialized.
+    """
+    frontmatter_data = metadata["frontmatter"]
+    if source is not None and frontmatter_unchanged(frontmatter_data, source):
+        return f"---\n{source}\n---"
+    return generate_yaml_frontmatter(frontmatter_data)
+
+
 def generate_workbook_markdown(
     workbook: "Workbook", schema: MultiTableParsingSchema
 ) -> str:
@@ -170,9 +196,8 @@ def generate_workbook_markdown(
 
     if is_frontmatter:
         # Output YAML frontmatter block
-        frontmatter_data = metadata.get("frontmatter", {})
-        if frontmatter_data:
-            lines.append(generate_yaml_frontmatter(frontmatter_data))
+        if metadata.get("frontmatter"):
+            lines.append(_frontmatter_block(metadata, workbook._frontmatter_source))
             lines.append("")
     elif schema.root_marker:
         lines.append(schema.root_marker)
@@ -189,8 +214,12 @@ def generate_workbook_markdown(
         lines.append(workbook.root_content)
         lines.append("")
 
+    # Sheets are added line by line so the whole document is joined only once
+    sheet_lines: list[str] = []
     for i, sheet in enumerate(workbook.sheets):
-        lines.append(generate_sheet_markdown(sheet, schema))
+        # An empty sheet still occupies one (blank) line
+        sheet_lines = _sheet_lines(sheet, schema) or [""]
+        lines.extend(sheet_lines)
         if i < len(workbook.sheets) - 1:
             lines.append("")  # Empty line between sheets
 
@@ -199,8 +228,13 @@ def generate_workbook_markdown(
         k: v for k, v in metadata.items() if k not in _METADATA_INTERNAL_KEYS
     }
     if comment_metadata:
-        # Ensure separation from last sheet
-        if lines and lines[-1] != "":
+        # Ensure separation from last sheet. The last sheet counts as one
+        # block here, even if its own final line is blank.
+        if workbook.sheets:
+            needs_separator = sheet_lines != [""]
+        else:
+            needs_separator = bool(lines) and lines[-1] != ""
+        if needs_separator:
             lines.append("")
 
         metadata_json = json.dumps(comment_metadata, ensure_ascii=False)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import Any, Literal, NotRequired, TypedDict, TypeVar
 
 from .generator import (
@@ -554,6 +554,9 @@ class Workbook:
     end_line: int | None = None
     metadata: dict[str, Any] | None = None
     root_content: str | None = None
+    # YAML frontmatter text the workbook root was parsed from. to_markdown()
+    # writes it back verbatim while metadata["frontmatter"] still matches it.
+    _frontmatter_source: str | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         if self.metadata is None:
@@ -1,11 +1,69 @@
 import json
 import re
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import replace
 from typing import Any
 
 from .models import AlignmentType, Sheet, Table, Workbook
 from .schemas import DEFAULT_SCHEMA, MultiTableParsingSchema, ParsingSchema
-from .yaml_parser import extract_frontmatter, parse_yaml_frontmatter
+from .utils import copy_plain_data
+from .yaml_parser import (
+    clear_frontmatter_cache,
+    extract_frontmatter,
+    parse_yaml_frontmatter,
+)
+
+# Single pattern for every md-spreadsheet metadata comment. The "kind" group
+# tells which model the JSON payload belongs to, so each line only needs one
+# regex call regardless of which metadata type the caller is looking for.
+_METADATA_COMMENT_RE = re.compile(
+    r"^<!-- md-spreadsheet-(?P<kind>table|sheet|workbook)-metadata: (?P<payload>.*) -->$",
+    re.MULTILINE,
+)
+_METADATA_COMMENT_PREFIX = "<!-- md-spreadsheet-"
+
+# <br>, <br/>, <br /> (case-insensitive)
+_BR_TAG_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+# Number of distinct (markdown, schema) pairs kept by parse_workbook. Editors
+# re-parse the same document on every keystroke, so a small window suffices.
+_WORKBOOK_CACHE_SIZE = 32
+_workbook_cache: OrderedDict[tuple[str, MultiTableParsingSchema], Workbook] = (
+    OrderedDict()
+)
+_workbook_cache_lock = threading.Lock()
+
+# Header names shorter than this are interned (see _intern_name).
+_INTERN_MAX_LEN = 64
+
+
+def _intern_name(name: str) -> str:
+    """
+    Intern a sheet/table/workbook name or column header.
+
+    The same few names ("Sheet 1", "Data", "Name", ...) recur across every
+    parsed document; interning lets them share one string object. Long names
+    are left alone so arbitrary header text does not fill the intern table.
+    """
+    if len(name) < _INTERN_MAX_LEN:
+        return sys.intern(name)
+    return name
+
+
+def _metadata_payload(line: str, kind: str) -> str | None:
+    """
+    Return the JSON payload if the line is a metadata comment of the given kind.
+    """
+    # Cheap prefix check first: almost no line is a metadata comment,
+    # so most lines never reach the regex engine or json.loads.
+    if not line.startswith(_METADATA_COMMENT_PREFIX):
+        return None
+    match = _METADATA_COMMENT_RE.match(line)
+    if match and match.group("kind") == kind:
+        return match.group("payload")
+    return None
 
 
 def clean_cell(cell: str, schema: ParsingSchema) -> str:
@@ -15,9 +73,10 @@ def clean_cell(cell: str, schema: ParsingSchema) -> str:
     if schema.strip_whitespace:
         cell = cell.strip()
 
-    if schema.convert_br_to_newline:
-        # Replace <br>, <br/>, <br /> (case-insensitive) with \n
-        cell = re.sub(r"<br\s*/?>", "\n", cell, flags=re.IGNORECASE)
+    # Replace <br>, <br/>, <br /> (case-insensitive) with \n. Most cells have
+    # no tag at all, and the substring test is far cheaper than a regex call.
+    if schema.convert_br_to_newline and "<" in cell:
+        cell = _BR_TAG_RE.sub("\n", cell)
 
     # Unescape the column separator (e.g. \| -> |)
     # We also need to handle \\ -> \
@@ -28,8 +87,6 @@ def clean_cell(cell: str, schema: ParsingSchema) -> str:
 
     return cell
 
-    return cell
-
 
 def split_row_gfm(line: str, separator: str) -> list[str]:
     """
@@ -37,6 +94,11 @@ def split_row_gfm(line: str, separator: str) -> list[str]:
     - Ignore separators inside inline code (backticks).
     - Ignore escaped separators.
     """
+    # Fast path: without escapes or inline code every separator is a real
+    # cell boundary, so the C-level str.split gives the same result.
+    if "\\" not in line and "`" not in line:
+        return line.split(separator)
+
     parts: list[str] = []
     current_part: list[str] = []
     in_code = False
@@ -93,14 +155,22 @@ def parse_row(line: str, schema: ParsingSchema) -> list[str] | None:
 
     # Handle outer pipes if present
     # If the line starts/ends with a separator (and it wasn't escaped),
-    # split will produce empty strings at start/end.
+    # split will produce empty strings at start/end. Both are dropped with a
+    # single slice.
     if len(parts) > 1:
-        if parts[0].strip() == "":
-            parts = parts[1:]
-        if parts and parts[-1].strip() == "":
-            parts = parts[:-1]
-
-    # Clean cells
+        start = 1 if parts[0].strip() == "" else 0
+        end = len(parts)
+        if end > start and parts[-1].strip() == "":
+            end -= 1
+        if start or end < len(parts):
+            parts = parts[start:end]
+
+    # Clean cells. Without a backslash or '<' anywhere on the line, clean_cell
+    # has nothing to unescape or convert, so cleaning is at most a strip.
+    if "\\" not in line and "<" not in line:
+        if schema.strip_whitespace:
+            return [part.strip() for part in parts]
+        return parts
     cleaned_parts = [clean_cell(part, schema) for part in parts]
     return cleaned_parts
 
@@ -169,7 +239,15 @@ def parse_table(markdown: str, schema: ParsingSchema = DEFAULT_SCHEMA) -> Table:
     Returns:
         Table object with headers and rows.
     """
-    lines = markdown.strip().split("\n")
+    return _parse_table_lines(markdown.strip().split("\n"), schema)
+
+
+def _parse_table_lines(lines: list[str], schema: ParsingSchema) -> Table:
+    """
+    Implementation of parse_table for callers that already hold the table as
+    lines (blank lines and surrounding whitespace are ignored, as in
+    parse_table).
+    """
     headers: list[str] | None = None
     rows: list[list[str]] = []
     alignments: list[AlignmentType] | None = None
@@ -185,12 +263,9 @@ def parse_table(markdown: str, schema: ParsingSchema = DEFAULT_SCHEMA) -> Table:
             continue
 
         # Check for metadata comment
-        metadata_match = re.match(
-            r"^<!-- md-spreadsheet-table-metadata: (.*) -->$", line
-        )
-        if metadata_match:
+        json_content = _metadata_payload(line, "table")
+        if json_content is not None:
             try:
-                json_content = metadata_match.group(1)
                 visual_metadata = json.loads(json_content)
                 continue
             except json.JSONDecodeError:
@@ -211,7 +286,7 @@ def parse_table(markdown: str, schema: ParsingSchema = DEFAULT_SCHEMA) -> Table:
         if headers is None and potential_header is not None:
             detected_alignments = parse_separator_row(parsed_row, schema)
             if detected_alignments is not None:
-                headers = potential_header
+                headers = [_intern_name(h) for h in potential_header]
                 alignments: list[AlignmentType] | None = detected_alignments
                 potential_header = None
                 continue
@@ -229,19 +304,17 @@ def parse_table(markdown: str, schema: ParsingSchema = DEFAULT_SCHEMA) -> Table:
     if potential_header is not None:
         rows.append(potential_header)
 
-    # Normalize rows to match header length
+    # Normalize rows to match header length, in place: most rows already
+    # match, so no second list of rows is built
     if headers:
         header_len = len(headers)
-        normalized_rows = []
-        for row in rows:
+        for i, row in enumerate(rows):
             if len(row) < header_len:
                 # Pad with empty strings
                 row.extend([""] * (header_len - len(row)))
             elif len(row) > header_len:
                 # Truncate
-                row = row[:header_len]
-            normalized_rows.append(row)
-        rows = normalized_rows
+                rows[i] = row[:header_len]
 
     metadata: dict[str, Any] = {"schema_used": str(schema)}
     if visual_metadata:
@@ -250,6 +323,15 @@ def parse_table(markdown: str, schema: ParsingSchema = DEFAULT_SCHEMA) -> Table:
     return Table(headers=headers, rows=rows, metadata=metadata, alignments=alignments)
 
 
+def _block_may_hold_table(block: list[str], schema: ParsingSchema) -> bool:
+    """
+    A block can only yield a table (or table metadata) if one of its lines
+    contains the column separator or a table metadata comment.
+    """
+    marker = _METADATA_COMMENT_PREFIX + "table-metadata:"
+    return any(schema.column_separator in line or marker in line for line in block)
+
+
 def _extract_tables_simple(
     lines: list[str], schema: ParsingSchema, start_line_offset: int
 ) -> list[Table]:
@@ -264,13 +346,9 @@ def _extract_tables_simple(
     for idx, line in enumerate(lines):
         if not line.strip():
             if current_block:
-                # Process block
-                block_text = "\n".join(current_block)
-                if (
-                    schema.column_separator in block_text
-                    or "<!-- md-spreadsheet-table-metadata:" in block_text
-                ):
-                    table = parse_table(block_text, schema)
+                # Process block (handed over as lines; no join and re-split)
+                if _block_may_hold_table(current_block, schema):
+                    table = _parse_table_lines(current_block, schema)
                     if table.rows or table.headers:
                         table = replace(
                             table,
@@ -299,12 +377,8 @@ def _extract_tables_simple(
 
     # Last block
     if current_block:
-        block_text = "\n".join(current_block)
-        if (
-            schema.column_separator in block_text
-            or "<!-- md-spreadsheet-table-metadata:" in block_text
-        ):
-            table = parse_table(block_text, schema)
+        if _block_may_hold_table(current_block, schema):
+            table = _parse_table_lines(current_block, schema)
             if table.rows or table.headers:
                 table = replace(
                     table,
@@ -335,12 +409,20 @@ def _extract_tables(
     If table_header_level is set, splits by that header.
     Otherwise, splits by blank lines.
     """
+    return _extract_tables_from_lines(text.split("\n"), schema, start_line_offset)
+
+
+def _extract_tables_from_lines(
+    lines: list[str], schema: MultiTableParsingSchema, start_line_offset: int = 0
+) -> list[Table]:
+    """
+    Same as _extract_tables, for callers that already hold the text as lines.
+    """
     if schema.table_header_level is None:
-        return _extract_tables_simple(text.split("\n"), schema, start_line_offset)
+        return _extract_tables_simple(lines, schema, start_line_offset)
 
     # Split by table header
     header_prefix = "#" * schema.table_header_level + " "
-    lines = text.split("\n")
     tables: list[Table] = []
 
     current_table_lines: list[str] = []
@@ -411,7 +493,7 @@ def _extract_tables(
         stripped = line.strip()
         if stripped.startswith(header_prefix):
             process_table_block(idx)
-            current_table_name = stripped[len(header_prefix) :].strip()
+            current_table_name = _intern_name(stripped[len(header_prefix) :].strip())
             current_table_lines = []
             current_description_lines = []
             current_block_start_line = idx
@@ -436,20 +518,44 @@ def parse_sheet(
     If the section contains valid tables, sheet_type="table" and content=None.
     If no tables are found, sheet_type="doc" and content stores the raw markdown.
     """
+    return _parse_sheet(markdown, markdown.split("\n"), name, schema, start_line_offset)
+
+
+def _parse_sheet(
+    markdown: str,
+    lines: list[str],
+    name: str,
+    schema: MultiTableParsingSchema,
+    start_line_offset: int,
+) -> Sheet:
+    """
+    Implementation of parse_sheet. `lines` must be `markdown.split("\n")`; callers
+    that already hold the section as lines pass them to avoid splitting again.
+    """
     metadata: dict[str, Any] | None = None
 
     # Scan for sheet metadata
     # We prioritize the first match if multiple exist (though usually only one)
-    metadata_match = re.search(
-        r"^<!-- md-spreadsheet-sheet-metadata: (.*) -->$", markdown, re.MULTILINE
-    )
-    if metadata_match:
-        try:
-            metadata = json.loads(metadata_match.group(1))
-        except json.JSONDecodeError:
-            pass  # Ignore invalid JSON
+    # Substring probe first so sheets without metadata skip the regex scan
+    if _METADATA_COMMENT_PREFIX + "sheet-metadata:" in markdown:
+        for metadata_match in _METADATA_COMMENT_RE.finditer(markdown):
+            if metadata_match.group("kind") != "sheet":
+                continue
+            try:
+                metadata = json.loads(metadata_match.group("payload"))
+            except json.JSONDecodeError:
+                pass  # Ignore invalid JSON
+            break
 
-    tables = _extract_tables(markdown, schema, start_line_offset)
+    # Table extraction only considers blocks containing a column separator or a
+    # table metadata comment, so sections with neither (doc and empty sheets)
+    # skip it entirely.
+    tables: list[Table] = []
+    if (
+        schema.column_separator in markdown
+        or _METADATA_COMMENT_PREFIX + "table-metadata:" in markdown
+    ):
+        tables = _extract_tables_from_lines(lines, schema, start_line_offset)
 
     # Determine sheet type based on whether tables were found
     if tables:
@@ -472,20 +578,38 @@ def parse_sheet(
         )
 
 
-def _has_h1_headers(lines: list[str]) -> bool:
-    """Check if any H1 headers exist in the given lines (outside code blocks)."""
-    in_code_block = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-        elif (
-            not in_code_block
-            and stripped.startswith("# ")
-            and not stripped.startswith("## ")
-        ):
-            return True
-    return False
+def _root_marker_name_level(root_marker: str) -> tuple[str, int]:
+    """Workbook name and header level implied by an explicit root marker."""
+    if root_marker.startswith("#"):
+        level = len(root_marker) - len(root_marker.lstrip("#"))
+        return root_marker[level:].strip(), level
+    return "Workbook", 1
+
+
+def _copy_table(table: Table) -> Table:
+    return replace(
+        table,
+        headers=list(table.headers) if table.headers is not None else None,
+        rows=[list(row) for row in table.rows],
+        alignments=(list(table.alignments) if table.alignments is not None else None),
+        metadata=copy_plain_data(table.metadata),
+    )
+
+
+def _copy_workbook(workbook: Workbook) -> Workbook:
+    """Copy a cached Workbook so callers never share its mutable state."""
+    return replace(
+        workbook,
+        sheets=[
+            replace(
+                sheet,
+                tables=[_copy_table(t) for t in sheet.tables],
+                metadata=copy_plain_data(sheet.metadata),
+            )
+            for sheet in workbook.sheets
+        ],
+        metadata=copy_plain_data(workbook.metadata),
+    )
 
 
 def parse_workbook(
@@ -502,87 +626,180 @@ def parse_workbook(
 
     When root_marker/sheet_header_level/table_header_level are None,
     they are auto-calculated from the detected workbook level.
+
+    Results are memoized per (markdown, schema) pair, so re-parsing an
+    unchanged document is cheap. Each call still returns a fresh copy that
+    callers may mutate freely. Call clear_parse_cache() to drop the memoized
+    results.
     """
+    key = (markdown, schema)
+    with _workbook_cache_lock:
+        cached = _workbook_cache.get(key)
+        if cached is not None:
+            _workbook_cache.move_to_end(key)
+    if cached is not None:
+        return _copy_workbook(cached)
+
+    # On a miss the fresh Workbook goes to the caller and the cache keeps a
+    # copy, so the cached object is never handed out directly.
+    workbook = _parse_workbook(markdown, schema)
+    snapshot = _copy_workbook(workbook)
+    with _workbook_cache_lock:
+        _workbook_cache[key] = snapshot
+        _workbook_cache.move_to_end(key)
+        if len(_workbook_cache) > _WORKBOOK_CACHE_SIZE:
+            _workbook_cache.popitem(last=False)
+    return workbook
+
+
+def clear_parse_cache() -> None:
+    """
+    Drop the results memoized by parse_workbook and frontmatter parsing.
+
+    Parsing again afterwards gives the same results; this only releases the
+    memory held for recently parsed documents.
+    """
+    with _workbook_cache_lock:
+        _workbook_cache.clear()
+    clear_frontmatter_cache()
+
+
+def _parse_workbook(markdown: str, schema: MultiTableParsingSchema) -> Workbook:
+    # Auto-detection needs an H1 (or "# Tables" / "# Workbook"), or a
+    # frontmatter title, to find a workbook. A document with neither, and no
+    # workbook metadata comment to pick up, always yields the same empty
+    # Workbook; this covers empty and plain-text input.
+    if (
+        schema.root_marker is None
+        and "#" not in markdown
+        and not markdown.startswith("---")
+        and _METADATA_COMMENT_PREFIX + "workbook-metadata:" not in markdown
+    ):
+        return Workbook(sheets=[], name="Workbook")
+
     frontmatter_text, remaining_markdown = extract_frontmatter(markdown)
+    # The YAML itself is only parsed once we know the frontmatter can become
+    # the workbook root (see below).
     frontmatter_metadata: dict[str, Any] = {}
-    if frontmatter_text is not None:
-        frontmatter_metadata = parse_yaml_frontmatter(frontmatter_text)
+    frontmatter_source: str | None = None
 
-    # If the frontmatter does not have a title, it does not constitute a Workbook,
-    # and its metadata should not be implicitly merged into subsequent Workbooks.
-    if "title" not in frontmatter_metadata:
-        frontmatter_metadata = {}
+    # One substring test over the whole text; when it fails, no line needs
+    # to be checked for a workbook metadata comment.
+    has_workbook_metadata = (
+        _METADATA_COMMENT_PREFIX + "workbook-metadata:" in remaining_markdown
+    )
+
+    # An explicit root marker is matched against whole stripped lines, so it
+    # can only be found if it occurs somewhere in the text. When it does not,
+    # and there is no workbook metadata comment to pick up either, the result
+    # is known without looking at a single line.
+    if (
+        schema.root_marker is not None
+        and schema.root_marker not in remaining_markdown
+        and not has_workbook_metadata
+    ):
+        return Workbook(sheets=[], name=_root_marker_name_level(schema.root_marker)[0])
 
     lines = remaining_markdown.split("\n")
-    sheets: list[Sheet] = []
     metadata: dict[str, Any] | None = None
 
     # Check for Workbook metadata at the end of the file
     # Scan for Workbook metadata anywhere in the file
     # We filter it out from the lines so it doesn't interfere with sheet content
+    # Every later pass works on stripped lines, so each line is stripped once
+    # here and kept in `stripped_lines`, index-aligned with `lines`.
     filtered_lines: list[str] = []
-    wb_metadata_pattern = re.compile(
-        r"^<!-- md-spreadsheet-workbook-metadata: (.*) -->$"
-    )
+    stripped_lines: list[str] = []
+    # Position (in filtered lines) of the first workbook metadata comment
+    metadata_line_idx: int | None = None
+    metadata_in_code_block = False
+    # The same pass classifies lines for the H1 lookups below: every line that
+    # looks like an H1 is recorded with the code block state in effect there,
+    # so auto-detection never has to walk the document again.
+    h1_lines: list[tuple[int, bool]] = []  # (line_index, in_code_block)
+    in_code_block = False
 
-    for line in lines:
-        stripped = line.strip()
-        match = wb_metadata_pattern.match(stripped)
-        if match:
-            try:
-                metadata = json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-            # Skip adding this line to filtered_lines
-        else:
-            filtered_lines.append(line)
+    if has_workbook_metadata:
+        for line in lines:
+            stripped = line.strip()
+            json_content = _metadata_payload(stripped, "workbook")
+            if json_content is not None:
+                try:
+                    metadata = json.loads(json_content)
+                except json.JSONDecodeError:
+                    pass
+                if metadata_line_idx is None:
+                    metadata_line_idx = len(filtered_lines)
+                    metadata_in_code_block = in_code_block
+                # Skip adding this line to filtered_lines
+            else:
+                if stripped.startswith("```"):
+                    in_code_block = not in_code_block
+                elif stripped.startswith("# "):
+                    h1_lines.append((len(filtered_lines), in_code_block))
+                filtered_lines.append(line)
+                stripped_lines.append(stripped)
+    else:
+        # Nothing to filter out: strip every line in one comprehension, then
+        # visit only the fence and H1 candidates instead of every line.
+        filtered_lines = lines
+        stripped_lines = [line.strip() for line in lines]
+        candidates = [
+            i
+            for i, stripped in enumerate(stripped_lines)
+            if stripped.startswith(("```", "# "))
+        ]
+        for i in candidates:
+            if stripped_lines[i].startswith("```"):
+                in_code_block = not in_code_block
+            else:
+                h1_lines.append((i, in_code_block))
 
     lines = filtered_lines
 
+    # H1 headers outside code blocks: (line_index, header_text)
+    h1_headers: list[tuple[int, str]] = [
+        (i, stripped_lines[i][2:].strip()) for i, in_code in h1_lines if not in_code
+    ]
+
     # Determine root marker and header levels
     root_marker = schema.root_marker
     workbook_name = "Workbook"
     workbook_level = 1  # Default H1
 
     virtual_root = False
-    if root_marker is None and "title" in frontmatter_metadata:
-        title_val = str(frontmatter_metadata["title"]).strip()
-        if title_val and not _has_h1_headers(lines):
-            # No actual H1 headers → frontmatter title is the workbook root
-            root_marker = "# " + title_val
-            workbook_name = title_val
-            workbook_level = 1
-            virtual_root = True
-        # else: H1 exists → frontmatter is a Document section,
-        # let normal auto-detection (below) handle workbook selection
+    # With an actual H1 the frontmatter is a Document section and normal
+    # auto-detection (below) handles workbook selection, so its YAML is only
+    # parsed when there is no H1 at all.
+    if root_marker is None and frontmatter_text is not None and not h1_headers:
+        frontmatter_metadata = parse_yaml_frontmatter(frontmatter_text)
+        # If the frontmatter does not have a title, it does not constitute a
+        # Workbook, and its metadata should not be implicitly merged into
+        # subsequent Workbooks.
+        if "title" not in frontmatter_metadata:
+            frontmatter_metadata = {}
+        else:
+            title_val = str(frontmatter_metadata["title"]).strip()
+            if title_val:
+                # No actual H1 headers → frontmatter title is the workbook root
+                root_marker = "# " + title_val
+                workbook_name = title_val
+                workbook_level = 1
+                virtual_root = True
 
     # Isolate frontmatter in sub-dict for round-trip fidelity
     # Only when frontmatter IS the workbook root (virtual_root)
-    if virtual_root and frontmatter_metadata:
+    if virtual_root and frontmatter_metadata and frontmatter_text is not None:
         if metadata is None:
             metadata = {}
         metadata["header_type"] = "frontmatter"
         metadata["frontmatter"] = frontmatter_metadata
+        # The original text lets the generator write the block back verbatim
+        # (comments and formatting included) while the data is unchanged.
+        frontmatter_source = frontmatter_text
 
     if root_marker is None:
-        # Auto-detection mode
-        # Find all H1 headers (not in code blocks)
-        h1_headers: list[tuple[int, str]] = []  # (line_index, header_text)
-        in_code_block = False
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith("```"):
-                in_code_block = not in_code_block
-            elif (
-                not in_code_block
-                and stripped.startswith("# ")
-                and not stripped.startswith("## ")
-            ):
-                # This is an H1 header (starts with "# " but not "## ")
-                header_text = stripped[2:].strip()
-                h1_headers.append((i, header_text))
-
+        # Auto-detection mode, using the H1 headers collected while filtering
         if len(h1_headers) == 1:
             # Single H1: use it as workbook
             root_marker = h1_headers[0][1]
@@ -593,42 +810,19 @@ def parse_workbook(
             # Step 3: If md-spreadsheet metadata exists, find the H1 that contains it
             # The metadata comment should be inside a section, so we find the H1
             # header that precedes the metadata comment location.
-            # Since we already extracted metadata, we need to find which H1 section
-            # contains it by re-scanning the original lines.
-
-            # Re-scan original lines to find metadata line index
-            original_lines = markdown.split("\n")
-            metadata_line_idx = None
-            for i, line in enumerate(original_lines):
-                stripped = line.strip()
-                if wb_metadata_pattern.match(stripped):
-                    metadata_line_idx = i
-                    break
+            # metadata_line_idx was recorded while filtering, so no re-scan of the
+            # document is needed.
 
             if metadata_line_idx is not None:
-                # Find the H1 header that precedes this metadata line
-                # Map original line indices to filtered line indices
                 selected_h1 = None
-                for line_idx, header_text in h1_headers:
-                    # h1_headers contains indices in filtered_lines
-                    # Need to find corresponding original index
-                    # Actually, h1_headers was built from filtered_lines (after metadata removal)
-                    # So we need to re-scan original to find H1 before metadata
-                    pass
 
-                # Simpler approach: scan original lines for H1 headers before metadata
-                in_code_block = False
-                for i in range(metadata_line_idx - 1, -1, -1):
-                    stripped = original_lines[i].strip()
-                    if stripped.startswith("```"):
-                        in_code_block = not in_code_block
-                    elif (
-                        not in_code_block
-                        and stripped.startswith("# ")
-                        and not stripped.startswith("## ")
-                    ):
+                # Closest H1 header before the metadata comment. Code blocks are
+                # counted from the comment backwards, so an H1 is outside one
+                # when it sits in the same fence state as the comment itself.
+                for i, in_code in reversed(h1_lines):
+                    if i < metadata_line_idx and in_code == metadata_in_code_block:
                         # Found the H1 header that contains the metadata
-                        header_text = stripped[2:].strip()
+                        header_text = stripped_lines[i][2:].strip()
                         root_marker = "# " + header_text
                         workbook_name = header_text
                         workbook_level = 1
@@ -648,36 +842,24 @@ def parse_workbook(
 
         if root_marker is None:
             # Multiple or no H1: fallback to "# Tables" or "# Workbook"
-            in_code_block = False
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                if stripped.startswith("```"):
-                    in_code_block = not in_code_block
-                elif not in_code_block:
-                    if stripped == "# Tables":
-                        root_marker = "# Tables"
-                        workbook_name = "Tables"
-                        workbook_level = 1
-                        break
-                    elif stripped == "# Workbook":
-                        root_marker = "# Workbook"
-                        workbook_name = "Workbook"
-                        workbook_level = 1
-                        break
+            for i, _ in h1_headers:
+                stripped = stripped_lines[i]
+                if stripped == "# Tables":
+                    root_marker = "# Tables"
+                    workbook_name = "Tables"
+                    workbook_level = 1
+                    break
+                elif stripped == "# Workbook":
+                    root_marker = "# Workbook"
+                    workbook_name = "Workbook"
+                    workbook_level = 1
+                    break
             if root_marker is None:
                 # No workbook found
                 return Workbook(sheets=[], name=workbook_name, metadata=metadata)
     else:
         # Explicit root_marker: extract name and level from it
-        if root_marker.startswith("#"):
-            level = 0
-            for char in root_marker:
-                if char == "#":
-                    level += 1
-                else:
-                    break
-            workbook_level = level
-            workbook_name = root_marker[level:].strip()
+        workbook_name, workbook_level = _root_marker_name_level(root_marker)
 
     # Calculate header levels if not explicitly set
     # Only auto-calculate from workbook_level if root_marker was auto-detected
@@ -718,9 +900,16 @@ def parse_workbook(
         start_index = 0
         workbook_start_line = 0
         found = True
-    else:
-        for i, line in enumerate(lines):
-            stripped = line.strip()
+    elif root_marker.startswith("# "):
+        # Only an H1 line can equal an H1 marker
+        for i, _ in h1_headers:
+            if stripped_lines[i] == root_marker:
+                start_index = i + 1
+                workbook_start_line = i
+                found = True
+                break
+    elif root_marker in remaining_markdown:
+        for i, stripped in enumerate(stripped_lines):
             if stripped.startswith("```"):
                 in_code_block = not in_code_block
 
@@ -736,8 +925,11 @@ def parse_workbook(
     # Split by sheet headers
     header_prefix = "#" * sheet_header_level + " "
 
+    # First pass: only locate sheet boundaries. Each sheet body is independent,
+    # so it is parsed afterwards from a slice of `lines` rather than being
+    # accumulated line by line while scanning.
+    sheet_bounds: list[tuple[str, int, int]] = []  # (name, content_start, end)
     current_sheet_name: str | None = None
-    current_sheet_lines: list[str] = []
     current_sheet_start_line = start_index
 
     # Reset code block state for the second pass
@@ -745,91 +937,77 @@ def parse_workbook(
     # We assume valid markdown structure where root marker is not inside a code block (handled above).
     in_code_block = False
 
-    # Capture root content (text between workbook header and first sheet header)
-    root_content_lines: list[str] = []
+    # Root content is the text between workbook header and first sheet header
+    root_content_end: int | None = None
 
-    # Track workbook section end line
-    # If loop breaks due to another H1, end is line before that H1
-    # Otherwise end is the last line of the file
-    workbook_end_line: int | None = None
+    # Workbook section end (exclusive): the line of the higher-level header
+    # that ends it, otherwise the end of the file
+    section_end = len(lines)
 
-    for idx, line in enumerate(lines[start_index:], start=start_index):
-        stripped = line.strip()
+    for idx in range(start_index, len(lines)):
+        stripped = stripped_lines[idx]
 
         if stripped.startswith("```"):
             in_code_block = not in_code_block
 
         if in_code_block:
-            # Just collect lines if we are in a sheet or root content
-            if current_sheet_name:
-                current_sheet_lines.append(line)
-            else:
-                root_content_lines.append(line)
-            workbook_end_line = idx + 1  # Track last line in section
+            # Code block lines always belong to the current sheet or root content
             continue
 
         # Check if line is a header
         if stripped.startswith("#"):
-            # Count header level
-            level = 0
-            for char in stripped:
-                if char == "#":
-                    level += 1
-                else:
-                    break
+            # Count header level (leading '#' run, scanned in C by lstrip)
+            level = len(stripped) - len(stripped.lstrip("#"))
 
             # If header level is less than sheet_header_level (e.g. # vs ##),
             # it indicates a higher-level section, so we stop parsing the workbook.
             if level < sheet_header_level:
-                # workbook_end_line is already set to last processed line
+                section_end = idx
                 break
 
             # If header match sheet_header_level, it's a new sheet
             if level == sheet_header_level and stripped.startswith(header_prefix):
-                if current_sheet_name:
-                    sheet_content = "\n".join(current_sheet_lines)
-                    sheets.append(
-                        parse_sheet(
-                            sheet_content,
-                            current_sheet_name,
-                            effective_schema,
-                            start_line_offset=current_sheet_start_line + 1,
-                        )
+                if current_sheet_name is not None:
+                    sheet_bounds.append(
+                        (current_sheet_name, current_sheet_start_line, idx)
                     )
+                else:
+                    root_content_end = idx
 
-                current_sheet_name = stripped[len(header_prefix) :].strip()
-                current_sheet_lines = []
-                current_sheet_start_line = idx
-                workbook_end_line = idx + 1
-                continue
-
-        # Not a sheet header
-        if current_sheet_name:
-            current_sheet_lines.append(line)
-        else:
-            # We are in root content area (between Workbook header and first Sheet)
-            root_content_lines.append(line)
+                current_sheet_name = _intern_name(
+                    stripped[len(header_prefix) :].strip()
+                )
+                current_sheet_start_line = idx + 1
 
-        workbook_end_line = idx + 1  # Track last line processed (exclusive end)
+    if current_sheet_name is not None:
+        sheet_bounds.append((current_sheet_name, current_sheet_start_line, section_end))
+    else:
+        root_content_end = section_end
 
-    if current_sheet_name:
-        sheet_content = "\n".join(current_sheet_lines)
+    # Second pass: parse each sheet body from its slice
+    sheets: list[Sheet] = []
+    for sheet_name, sheet_start, sheet_end in sheet_bounds:
+        sheet_lines = lines[sheet_start:sheet_end]
         sheets.append(
-            parse_sheet(
-                sheet_content,
-                current_sheet_name,
+            _parse_sheet(
+                "\n".join(sheet_lines),
+                sheet_lines,
+                sheet_name,
                 effective_schema,
-                start_line_offset=current_sheet_start_line + 1,
+                start_line_offset=sheet_start,
             )
         )
 
-    # If no lines were processed, end_line is start_line + 1
-    if workbook_end_line is None:
+    # The section ends where the scan stopped. If it stopped before processing
+    # any line, end_line is start_line + 1
+    workbook_end_line: int | None = section_end
+    if section_end == start_index:
         workbook_end_line = (
             workbook_start_line + 1 if workbook_start_line is not None else None
         )
 
     root_content: str | None = None
+    root_content_lines = lines[start_index:root_content_end]
     if root_content_lines:
         content = "\n".join(root_content_lines)
         if content.strip():
@@ -837,11 +1015,12 @@ def parse_workbook(
 
     return Workbook(
         sheets=sheets,
-        name=workbook_name,
+        name=_intern_name(workbook_name),
         start_line=workbook_start_line,
         end_line=workbook_end_line,
         metadata=metadata,
         root_content=root_content,
+        _frontmatter_source=frontmatter_source,
     )
 
 
@@ -1,6 +1,21 @@
+from typing import Any
+
+
 def normalize_header(header: str) -> str:
     """
     Normalizes a header string to match field names (lowercase, snake_case).
     Example: "User Name" -> "user_name"
     """
     return header.lower().replace(" ", "_").strip()
+
+
+def copy_plain_data(value: Any) -> Any:
+    """
+    Copies parsed JSON/YAML data. Only dicts and lists are mutable there,
+    so this is a much cheaper stand-in for copy.deepcopy.
+    """
+    if isinstance(value, dict):
+        return {key: copy_plain_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_plain_data(item) for item in value]
+    return value
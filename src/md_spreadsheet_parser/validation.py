@@ -1,7 +1,16 @@
+import functools
 import json
 import types
-from dataclasses import fields, is_dataclass
-from typing import TYPE_CHECKING, Any, Type, TypeVar, get_args, get_origin, is_typeddict
+from collections.abc import Callable
+from dataclasses import Field, fields, is_dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeVar,
+    get_args,
+    get_origin,
+    is_typeddict,
+)
 
 if TYPE_CHECKING:
     from .models import Table
@@ -25,15 +34,31 @@ class TableValidationError(Exception):
 
 
 def _convert_value(
-    value: str, target_type: Type, schema: ConversionSchema = DEFAULT_CONVERSION_SCHEMA
+    value: str, target_type: type, schema: ConversionSchema = DEFAULT_CONVERSION_SCHEMA
 ) -> Any:
     """
     Converts a string value to the target type.
     Supports int, float, bool, str, and Optional types.
     """
+    return _value_converter(target_type, schema)(value)
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+def _value_converter(
+    target_type: type, schema: ConversionSchema = DEFAULT_CONVERSION_SCHEMA
+) -> Callable[[str], Any]:
+    """
+    Resolves the conversion for target_type once and returns it as a function.
+
+    Validation calls this once per column rather than once per cell, so the
+    type inspection below is not repeated for every row.
+    """
     # Check custom converters first
     if target_type in schema.custom_converters:
-        return schema.custom_converters[target_type](value)
+        return schema.custom_converters[target_type]
 
     origin = get_origin(target_type)
     args = get_args(target_type)
@@ -42,60 +67,119 @@ def _convert_value(
     # Robust check for Union-like types
     if origin is not None and (origin is types.UnionType or "Union" in str(origin)):
         if type(None) in args:
-            if not value.strip():
-                return None
             # Find the non-None type
             for arg in args:
                 if arg is not type(None):
-                    return _convert_value(value, arg, schema)
+                    inner = _value_converter(arg, schema)
+                    break
+            else:
+                inner = _identity
+
+            def convert_optional(value: str) -> Any:
+                if not value.strip():
+                    return None
+                return inner(value)
+
+            return convert_optional
 
     # Handle basic types
     if target_type is int:
-        if not value.strip():
-            raise ValueError("Empty value for int field")
-        return int(value)
+
+        def convert_int(value: str) -> int:
+            if not value.strip():
+                raise ValueError("Empty value for int field")
+            return int(value)
+
+        return convert_int
 
     if target_type is float:
-        if not value.strip():
-            raise ValueError("Empty value for float field")
-        return float(value)
+
+        def convert_float(value: str) -> float:
+            if not value.strip():
+                raise ValueError("Empty value for float field")
+            return float(value)
+
+        return convert_float
 
     if target_type is bool:
-        lower_val = value.lower().strip()
-        for true_val, false_val in schema.boolean_pairs:
-            if lower_val == true_val.lower():
-                return True
-            if lower_val == false_val.lower():
-                return False
+        lowered_pairs = [
+            (true_val.lower(), false_val.lower())
+            for true_val, false_val in schema.boolean_pairs
+        ]
+
+        def convert_bool(value: str) -> bool:
+            lower_val = value.lower().strip()
+            for true_val, false_val in lowered_pairs:
+                if lower_val == true_val:
+                    return True
+                if lower_val == false_val:
+                    return False
 
-        raise ValueError(f"Invalid boolean value: '{value}'")
+            raise ValueError(f"Invalid boolean value: '{value}'")
+
+        return convert_bool
 
     if target_type is str:
-        return value
+        return _identity
 
     # JSON Parsing for dict/list
     # Logic: If target is strict dict or list, try parsing as JSON
     # This covers dict, list, dict[str, Any], list[int], etc.
     if origin in (dict, list) or target_type in (dict, list):
-        if not value.strip():
-            # Empty string -> Empty dict/list? Or None?
-            # Let's say empty string is not valid JSON, so strictly it should fail or return empty type.
-            # For user friendliness, let's treat empty string as empty container if not Optional
-            # For user friendliness, let's treat empty string as empty container if not Optional
-            if origin:
-                return origin()  # type: ignore
-            if target_type is dict:
-                return {}
-            if target_type is list:
-                return []
-            return target_type()  # type: ignore
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON for {target_type}: {e}")
+
+        def convert_json(value: str) -> Any:
+            if not value.strip():
+                # Empty string is not valid JSON; for user friendliness it
+                # becomes an empty container if not Optional
+                if origin:
+                    return origin()  # type: ignore
+                if target_type is dict:
+                    return {}
+                if target_type is list:
+                    return []
+                return target_type()  # type: ignore
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON for {target_type}: {e}")
+
+        return convert_json
 
     # Fallback for other types (or if type hint is missing)
-    return value
+    return _identity
+
+
+def _column_converter(
+    target_type: type, schema: ConversionSchema
+) -> Callable[[str], Any]:
+    """
+    _value_converter, shared across validate_table calls where possible.
+
+    Without custom converters the result depends only on the type and the
+    boolean pairs, both hashable, so it is resolved once per process.
+    """
+    try:
+        if schema.custom_converters:
+            return _value_converter(target_type, schema)
+        return _builtin_value_converter(target_type, schema.boolean_pairs)
+    except TypeError:
+        # Unhashable annotations, e.g. Annotated[str, {"unit": "kg"}], can be
+        # neither cached nor looked up in custom_converters. Resolve per cell
+        # instead, so the failure is reported as a TableValidationError.
+        return functools.partial(_convert_value, target_type=target_type, schema=schema)
+
+
+@functools.lru_cache(maxsize=256)
+def _builtin_value_converter(
+    target_type: type, boolean_pairs: tuple[tuple[str, str], ...]
+) -> Callable[[str], Any]:
+    return _value_converter(target_type, ConversionSchema(boolean_pairs=boolean_pairs))
+
+
+@functools.lru_cache(maxsize=128)
+def _dataclass_fields(schema_cls: type) -> dict[str, Field]:
+    """Fields of a dataclass by name; looked up once per class."""
+    return {f.name: f for f in fields(schema_cls)}
 
 
 # --- Pydantic Support (Optional) ---
@@ -112,21 +196,35 @@ except ImportError:
 
 def _validate_table_dataclass(
     table: "Table",
-    schema_cls: Type[T],
+    schema_cls: type[T],
     conversion_schema: ConversionSchema,
 ) -> list[T]:
     """
     Validates a Table using standard dataclasses.
     """
     # Map headers to fields
-    cls_fields = {f.name: f for f in fields(schema_cls)}  # type: ignore
+    cls_fields = _dataclass_fields(schema_cls)
     header_map: dict[int, str] = {}  # column_index -> field_name
 
     normalized_headers = [normalize_header(h) for h in (table.headers or [])]
 
     for idx, header in enumerate(normalized_headers):
         if header in cls_fields:
-            header_map[idx] = header
+            # Keep the field's own (interned) name, so the keyword arguments
+            # built per row match the constructor's parameters by identity.
+            header_map[idx] = cls_fields[header].name
+
+    # Resolve one converter per mapped column up front
+    converters: dict[int, Callable[[str], Any]] = {}
+    for idx, field_name in header_map.items():
+        # Check for field-specific converter first
+        if field_name in conversion_schema.field_converters:
+            converters[idx] = conversion_schema.field_converters[field_name]
+        else:
+            converters[idx] = _column_converter(
+                cls_fields[field_name].type,  # type: ignore
+                conversion_schema,
+            )
 
     # Process rows
     results: list[T] = []
@@ -137,25 +235,15 @@ def _validate_table_dataclass(
         row_errors = []
 
         for col_idx, cell_value in enumerate(row):
-            if col_idx in header_map:
+            if col_idx in converters:
                 field_name = header_map[col_idx]
-                field_def = cls_fields[field_name]
 
                 try:
-                    # Check for field-specific converter first
-                    if field_name in conversion_schema.field_converters:
-                        converter = conversion_schema.field_converters[field_name]
-                        converted_value = converter(cell_value)
-                    else:
-                        converted_value = _convert_value(
-                            cell_value,
-                            field_def.type,  # type: ignore
-                            conversion_schema,  # type: ignore
-                        )
-                    row_data[field_name] = converted_value
+                    row_data[field_name] = converters[col_idx](cell_value)
                 except ValueError as e:
                     row_errors.append(f"Column '{field_name}': {str(e)}")
                 except Exception:
+                    field_def = cls_fields[field_name]
                     row_errors.append(
                         f"Column '{field_name}': Failed to convert '{cell_value}' to {field_def.type}"
                     )
@@ -180,7 +268,7 @@ def _validate_table_dataclass(
 
 def _validate_table_typeddict(
     table: "Table",
-    schema_cls: Type[T],
+    schema_cls: type[T],
     conversion_schema: ConversionSchema,
 ) -> list[T]:
     """
@@ -204,6 +292,14 @@ def _validate_table_typeddict(
                 header_map[idx] = key
                 break
 
+    # Resolve one converter per mapped column up front
+    converters: dict[int, Callable[[str], Any]] = {}
+    for idx, key in header_map.items():
+        if key in conversion_schema.field_converters:
+            converters[idx] = conversion_schema.field_converters[key]
+        else:
+            converters[idx] = _column_converter(annotations[key], conversion_schema)
+
     results: list[T] = []
     errors: list[str] = []
 
@@ -212,19 +308,11 @@ def _validate_table_typeddict(
         row_errors = []
 
         for col_idx, cell_value in enumerate(row):
-            if col_idx in header_map:
+            if col_idx in converters:
                 key = header_map[col_idx]
-                target_type = annotations[key]
 
                 try:
-                    if key in conversion_schema.field_converters:
-                        converter = conversion_schema.field_converters[key]
-                        converted_value = converter(cell_value)
-                    else:
-                        converted_value = _convert_value(
-                            cell_value, target_type, conversion_schema
-                        )
-                    row_data[key] = converted_value
+                    row_data[key] = converters[col_idx](cell_value)
                 except Exception as e:
                     row_errors.append(f"Column '{key}': {str(e)}")
 
@@ -296,7 +384,7 @@ def _validate_table_dict(
 
 def validate_table(
     table: "Table",
-    schema_cls: Type[T],
+    schema_cls: type[T],
     conversion_schema: ConversionSchema = DEFAULT_CONVERSION_SCHEMA,
 ) -> list[T]:
     """
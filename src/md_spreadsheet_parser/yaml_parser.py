@@ -1,10 +1,12 @@
-import re
+import functools
+import sys
 from typing import Any
 
-# Pattern to extract YAML frontmatter. (?:(.*?)\n)? allows empty frontmatter block
-_FRONTMATTER_PATTERN = re.compile(
-    r"^---\n(?:(.*?)\n)?---(?:\n|$)", re.DOTALL | re.MULTILINE
-)
+from .utils import copy_plain_data
+
+# Number of distinct frontmatter texts whose parse results are kept. The same
+# few blocks (templates, the document being edited) are parsed over and over.
+_FRONTMATTER_CACHE_SIZE = 256
 
 
 def extract_frontmatter(markdown: str) -> tuple[str | None, str]:
@@ -14,19 +16,45 @@ def extract_frontmatter(markdown: str) -> tuple[str | None, str]:
     Returns:
         tuple[str | None, str]: (frontmatter_content, remaining_markdown)
     """
-    match = _FRONTMATTER_PATTERN.match(markdown)
-    if match:
-        content = match.group(1) if match.group(1) is not None else ""
-        return content, markdown[match.end() :]
+    if not markdown.startswith("---\n"):
+        return None, markdown
+
+    # The closing delimiter is a "---" line after at least one content line
+    # (possibly empty), found with str.find instead of a per-line scan. A
+    # closing line anywhere in the document wins over an immediately closed
+    # (empty) block.
+    idx = markdown.find("\n---", 4)
+    while idx != -1:
+        end = idx + 4
+        if end == len(markdown):
+            return markdown[4:idx], ""
+        if markdown[end] == "\n":
+            return markdown[4:idx], markdown[end + 1 :]
+        idx = markdown.find("\n---", idx + 1)
+
+    # Empty frontmatter block: "---" immediately followed by "---"
+    if markdown.startswith("---", 4):
+        if len(markdown) == 7:
+            return "", ""
+        if markdown[7] == "\n":
+            return "", markdown[8:]
     return None, markdown
 
 
 def _strip_inline_comment(val: str) -> str:
     """Safely strip inline comments from a value string."""
     val = val.strip()
-    if not val:
+    if not val or "#" not in val:
         return val
 
+    # Without quotes no '#' can be protected: the comment starts at the first
+    # '#' at the start of the value or after a space or tab
+    if '"' not in val and "'" not in val:
+        if val[0] == "#":
+            return ""
+        starts = [i for i in (val.find(" #"), val.find("\t#")) if i != -1]
+        return val[: min(starts)].strip() if starts else val
+
     # If it's fully quoted, don't strip internal comments
     if (val.startswith('"') and val.endswith('"')) or (
         val.startswith("'") and val.endswith("'")
@@ -58,19 +86,127 @@ def parse_yaml_frontmatter(yaml_text: str) -> dict[str, Any]:
     - Comments (lines starting with '#' or inline '#')
     - Multiline literal blocks ('|')
     - Nested dictionaries via indentation
+
+    Results are memoized per text; each call returns a fresh copy that
+    callers may mutate freely. clear_parse_cache() drops the memoized results.
     """
+    return copy_plain_data(_parse_yaml_frontmatter_cached(yaml_text))
+
+
+@functools.lru_cache(maxsize=_FRONTMATTER_CACHE_SIZE)
+def _parse_yaml_frontmatter_cached(yaml_text: str) -> dict[str, Any]:
+    # The cached dict is shared; only read it, or copy it (see above).
     if not yaml_text.strip():
         return {}
 
     lines = yaml_text.split("\n")
-    return _parse_yaml_lines(lines, 0, len(lines), 0)[0]
+    # Comments and `key:` lines opening a nested block always need the full
+    # parser, so the fast path is not even attempted for them
+    if "#" not in yaml_text and ":\n" not in yaml_text:
+        result = _parse_flat_yaml_lines(lines)
+        if result is not None:
+            return result
+    # Strip and measure every line once up front; the recursive parser looks
+    # them up by index, including when it peeks ahead for nested blocks.
+    stripped_lines = [line.strip() for line in lines]
+    indents = [len(line) - len(line.lstrip()) for line in lines]
+    return _parse_yaml_lines(lines, stripped_lines, indents, 0, len(lines), 0)[0]
+
+
+def clear_frontmatter_cache() -> None:
+    """Drop the results memoized by parse_yaml_frontmatter."""
+    _parse_yaml_frontmatter_cached.cache_clear()
+
+
+def frontmatter_unchanged(data: dict[str, Any], yaml_text: str) -> bool:
+    """
+    Whether data is exactly what yaml_text parses to.
+
+    Stricter than comparing with ==, which treats True == 1 and 2.0 == 2 as
+    equal; mapping key order counts too, as keys are written in that order.
+    When it holds, yaml_text can be written back instead of re-serializing
+    data, keeping its comments and formatting.
+    """
+    # Read-only comparison, so the memoized parse is used without copying
+    return _same_yaml_data(_parse_yaml_frontmatter_cached(yaml_text), data)
+
+
+def _same_yaml_data(a: Any, b: Any) -> bool:
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and list(a) == list(b)
+            and all(_same_yaml_data(value, b[key]) for key, value in a.items())
+        )
+    if isinstance(a, list):
+        return (
+            type(b) is list
+            and len(a) == len(b)
+            and all(_same_yaml_data(x, y) for x, y in zip(a, b))
+        )
+    return type(a) is type(b) and a == b
+
+
+def _parse_flat_yaml_lines(lines: list[str]) -> dict[str, Any] | None:
+    """
+    Fast path for the common frontmatter shape: only `key: scalar` lines.
+
+    Returns None as soon as a line needs the full parser (comments, nested
+    dicts, lists or multiline blocks); otherwise the result is identical to
+    `_parse_yaml_lines`.
+    """
+    result: dict[str, Any] = {}
+    for line in lines:
+        if "#" in line:
+            return None
+        key, sep, raw_val = line.partition(":")
+        if not sep:
+            # Blank or malformed line, skipped by the full parser as well
+            continue
+        val = raw_val.strip()
+        if val == "" or val == "|":
+            return None
+        result[sys.intern(key.strip())] = _parse_scalar(val)
+    return result
+
+
+def _next_content_line(stripped_lines: list[str], idx: int, end_idx: int) -> int:
+    """Index of the first line from idx that is neither blank nor a comment."""
+    while idx < end_idx and (
+        not stripped_lines[idx] or stripped_lines[idx].startswith("#")
+    ):
+        idx += 1
+    return idx
+
+
+def _join_block_scalar(body: list[str], indent: int) -> str:
+    """
+    Join the body lines of a `|` block, dropping trailing blank lines.
+
+    `indent` is the indentation of the first content line; the body only
+    holds lines indented at least that far (plus blank ones), so removing it
+    keeps any deeper indentation intact.
+    """
+    while body and not body[-1].strip():
+        body.pop()
+    prefix = " " * indent
+    return "\n".join(
+        [line[indent:] if line.startswith(prefix) else line.lstrip() for line in body]
+    )
 
 
 def _parse_yaml_lines(
-    lines: list[str], start_idx: int, end_idx: int, base_indent: int
+    lines: list[str],
+    stripped_lines: list[str],
+    indents: list[int],
+    start_idx: int,
+    end_idx: int,
+    base_indent: int,
 ) -> tuple[dict[str, Any], int]:
     """
     Recursively parse YAML lines into a dictionary.
+    `stripped_lines` and `indents` hold each line's stripped text and
+    indentation, index-aligned with `lines`.
     Returns the parsed dictionary and the next line index to process.
     """
     result: dict[str, Any] = {}
@@ -88,7 +224,7 @@ def _parse_yaml_lines(
         # Handle multiline collection
         if in_multiline:
             # Check if we should exit multiline
-            if not line.strip() or len(line) - len(line.lstrip()) >= multiline_indent:
+            if not stripped_lines[i] or indents[i] >= multiline_indent:
                 if current_key:
                     multiline_buffer.append(line)
                 i += 1
@@ -96,22 +232,14 @@ def _parse_yaml_lines(
             else:
                 # End of multiline
                 if current_key is not None:
-                    # Remove trailing empty lines and join
-                    while multiline_buffer and not multiline_buffer[-1].strip():
-                        multiline_buffer.pop()
-                    # Strip base indent from multiline buffer
-                    cleaned_buffer = [
-                        line_str[multiline_indent:]
-                        if line_str.startswith(" " * multiline_indent)
-                        else line_str.lstrip()
-                        for line_str in multiline_buffer
-                    ]
-                    result[current_key] = "\n".join(cleaned_buffer)
+                    result[current_key] = _join_block_scalar(
+                        multiline_buffer, multiline_indent
+                    )
                 in_multiline = False
                 current_key = None
                 multiline_buffer = []
 
-        stripped = line.strip()
+        stripped = stripped_lines[i]
 
         # Skip empty lines or pure comments
         if not stripped or stripped.startswith("#"):
@@ -119,42 +247,41 @@ def _parse_yaml_lines(
             continue
 
         # Determine indentation
-        indent = len(line) - len(line.lstrip())
+        indent = indents[i]
 
         # If we hit an unindented line, and we are in a recursive call, return
         if indent < base_indent:
             break
 
-        parts = stripped.split(":", 1)
-        if len(parts) == 1:
+        raw_key, sep, raw_val = stripped.partition(":")
+        if not sep:
             # Malformed line or continuation (not supported outside multiline)
             i += 1
             continue
 
-        key = parts[0].strip()
-        raw_val = parts[1].strip() if len(parts) > 1 else ""
-
+        # Keys (title, tags, author, ...) repeat across documents; intern them
+        # so every parsed frontmatter shares one string per key.
+        key = sys.intern(raw_key.strip())
         stripped_val = _strip_inline_comment(raw_val)
 
         if stripped_val == "":
             # Could be start of dict, list, or multiline string
-            next_line_idx = i + 1
-            while next_line_idx < end_idx and (
-                not lines[next_line_idx].strip()
-                or lines[next_line_idx].strip().startswith("#")
-            ):
-                next_line_idx += 1
+            next_line_idx = _next_content_line(stripped_lines, i + 1, end_idx)
 
             if next_line_idx < end_idx:
-                next_line = lines[next_line_idx]
-                next_indent = len(next_line) - len(next_line.lstrip())
-                next_stripped = next_line.strip()
+                next_indent = indents[next_line_idx]
+                next_stripped = stripped_lines[next_line_idx]
 
                 if next_indent > indent:
                     if next_stripped.startswith("- "):
                         # Parse list
                         parsed_list, new_idx = _parse_yaml_list(
-                            lines, next_line_idx, end_idx, next_indent
+                            lines,
+                            stripped_lines,
+                            indents,
+                            next_line_idx,
+                            end_idx,
+                            next_indent,
                         )
                         result[key] = parsed_list
                         i = new_idx
@@ -162,7 +289,12 @@ def _parse_yaml_lines(
                     else:
                         # Parse nested dict
                         parsed_dict, new_idx = _parse_yaml_lines(
-                            lines, next_line_idx, end_idx, next_indent
+                            lines,
+                            stripped_lines,
+                            indents,
+                            next_line_idx,
+                            end_idx,
+                            next_indent,
                         )
                         result[key] = parsed_dict
                         i = new_idx
@@ -182,17 +314,10 @@ def _parse_yaml_lines(
             current_key = key
 
             # Find the indentation of the first non-empty line
-            next_line_idx = i + 1
-            while next_line_idx < end_idx and (
-                not lines[next_line_idx].strip()
-                or lines[next_line_idx].strip().startswith("#")
-            ):
-                next_line_idx += 1
+            next_line_idx = _next_content_line(stripped_lines, i + 1, end_idx)
 
             if next_line_idx < end_idx:
-                multiline_indent = len(lines[next_line_idx]) - len(
-                    lines[next_line_idx].lstrip()
-                )
+                multiline_indent = indents[next_line_idx]
                 if multiline_indent <= indent:
                     # Invalid multiline indent, fallback
                     in_multiline = False
@@ -210,35 +335,31 @@ def _parse_yaml_lines(
 
     # Flush multiline
     if in_multiline and current_key is not None:
-        while multiline_buffer and not multiline_buffer[-1].strip():
-            multiline_buffer.pop()
-        cleaned_buffer = [
-            line_str[multiline_indent:]
-            if line_str.startswith(" " * multiline_indent)
-            else line_str.lstrip()
-            for line_str in multiline_buffer
-        ]
-        result[current_key] = "\n".join(cleaned_buffer)
+        result[current_key] = _join_block_scalar(multiline_buffer, multiline_indent)
 
     return result, i
 
 
 def _parse_yaml_list(
-    lines: list[str], start_idx: int, end_idx: int, base_indent: int
+    lines: list[str],
+    stripped_lines: list[str],
+    indents: list[int],
+    start_idx: int,
+    end_idx: int,
+    base_indent: int,
 ) -> tuple[list[Any], int]:
     """Parse a YAML block sequence recursively."""
     result: list[Any] = []
     i = start_idx
 
     while i < end_idx:
-        line = lines[i]
-        stripped = line.strip()
+        stripped = stripped_lines[i]
 
         if not stripped or stripped.startswith("#"):
             i += 1
             continue
 
-        indent = len(line) - len(line.lstrip())
+        indent = indents[i]
         if indent < base_indent:
             break
 
@@ -248,20 +369,19 @@ def _parse_yaml_list(
 
             if stripped_val == "":
                 # Could be nested structure or empty item
-                next_line_idx = i + 1
-                while next_line_idx < end_idx and (
-                    not lines[next_line_idx].strip()
-                    or lines[next_line_idx].strip().startswith("#")
-                ):
-                    next_line_idx += 1
+                next_line_idx = _next_content_line(stripped_lines, i + 1, end_idx)
 
                 if next_line_idx < end_idx:
-                    next_line = lines[next_line_idx]
-                    next_indent = len(next_line) - len(next_line.lstrip())
+                    next_indent = indents[next_line_idx]
 
                     if next_indent > indent:
                         parsed_dict, new_idx = _parse_yaml_lines(
-                            lines, next_line_idx, end_idx, next_indent
+                            lines,
+                            stripped_lines,
+                            indents,
+                            next_line_idx,
+                            end_idx,
+                            next_indent,
                         )
                         result.append(parsed_dict)
                         i = new_idx
@@ -304,12 +424,13 @@ def _parse_scalar(val: str) -> Any:
         except ValueError:
             pass
 
-    # Standard floats
-    try:
-        if "." in val:
+    # Standard floats. Only values starting like a number are tried, so text
+    # with a dot in it (sentences, URLs, versions) raises no ValueError.
+    if "." in val and (val[0] in "+-." or val[0].isdigit()):
+        try:
             return float(val)
-    except ValueError:
-        pass
+        except ValueError:
+            pass
 
     return val
 
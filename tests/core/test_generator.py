@@ -159,3 +159,17 @@ def test_table_to_markdown_mixed_empty_and_nonempty_cells():
 | hello | | world |"""
 
     assert markdown.strip() == expected.strip()
+
+
+def test_table_to_markdown_non_str_cells():
+    """Non-str cells are stringified, as they were before the join fast path."""
+    table = Table(headers=["A", "B"], rows=[[1, 2.5], [0, "x"]])  # type: ignore[list-item]
+    schema = ParsingSchema(require_outer_pipes=True, convert_br_to_newline=False)
+    markdown = table.to_markdown(schema)
+
+    expected = """| A | B |
+| --- | --- |
+| 1 | 2.5 |
+| | x |"""
+
+    assert markdown.strip() == expected.strip()
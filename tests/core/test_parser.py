@@ -3,6 +3,7 @@ from md_spreadsheet_parser import (
     parse_table,
     parse_workbook,
     scan_tables,
+    clear_parse_cache,
     MultiTableParsingSchema,
     Workbook,
 )
@@ -293,3 +294,60 @@ def test_lookup_api():
     assert table_b is not None
 
     assert sheet1.get_table("NonExistent") is None
+
+
+def test_repeated_parse_returns_independent_workbooks():
+    markdown = """
+# Tables
+
+## Sheet 1
+
+| A | B |
+| - | - |
+| 1 | 2 |
+
+<!-- md-spreadsheet-table-metadata: {"column_widths": [10, 20]} -->
+"""
+    first = parse_workbook(markdown)
+    second = parse_workbook(markdown)
+
+    assert first == second
+    assert first is not second
+
+    # Mutating one result must not leak into later parses of the same text.
+    first_table_metadata = first.sheets[0].tables[0].metadata
+    assert first_table_metadata is not None
+    assert first.metadata is not None
+    first.sheets[0].tables[0].rows[0][0] = "changed"
+    first_table_metadata["visual"]["column_widths"].append(30)
+    first.metadata["extra"] = True
+
+    third = parse_workbook(markdown)
+    third_table_metadata = third.sheets[0].tables[0].metadata
+    assert third_table_metadata is not None
+    assert third.metadata is not None
+    assert third.sheets[0].tables[0].rows == [["1", "2"]]
+    assert third_table_metadata["visual"]["column_widths"] == [10, 20]
+    assert "extra" not in third.metadata
+
+
+def test_clear_parse_cache():
+    markdown = """---
+title: Cached Book
+tags:
+  - a
+---
+
+## Sheet 1
+
+| A |
+| - |
+| 1 |
+"""
+    first = parse_workbook(markdown)
+    clear_parse_cache()
+
+    # Clearing only drops memoized results; parsing again gives the same result
+    second = parse_workbook(markdown)
+    assert second == first
+    assert second is not first
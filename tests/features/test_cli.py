@@ -1,6 +1,8 @@
 import json
 import subprocess
 
+import pytest
+
 
 CLI_CMD = ["uv", "run", "md-spreadsheet-parser"]
 
@@ -150,3 +152,55 @@ def test_cli_no_strip_whitespace():
     data = json.loads(result.stdout)
     # With strip disabled, spaces persist
     assert data[0]["rows"][0] == ["  Value  "]
+
+
+def test_cli_json_output_matches_stdlib(monkeypatch):
+    from md_spreadsheet_parser import cli
+
+    data = {
+        "name": "表",
+        "sheets": [],
+        "metadata": {
+            "big": 2**70,
+            "ratio": 0.5,
+            "small": 1e-07,
+            "huge": 1e16,
+            "values": [float("nan"), float("inf"), float("-inf")],
+        },
+    }
+    expected = json.dumps(data, indent=2, ensure_ascii=False)
+
+    # orjson (when installed) and the stdlib fallback produce the same text
+    assert cli._dumps(data) == expected
+    assert cli._dumps({"ratio": 0.5}) == json.dumps({"ratio": 0.5}, indent=2)
+    monkeypatch.setattr(cli, "HAS_ORJSON", False)
+    assert cli._dumps(data) == expected
+
+
+def test_cli_json_output_uses_orjson(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    from md_spreadsheet_parser import cli
+
+    calls = []
+    real_dumps = orjson.dumps
+
+    def spy_dumps(*args, **kwargs):
+        calls.append(args)
+        return real_dumps(*args, **kwargs)
+
+    monkeypatch.setattr(orjson, "dumps", spy_dumps)
+    table = {
+        "name": "T",
+        "headers": ["A", "B"],
+        "rows": [["1", "表"]],
+        "metadata": {"ratio": 0.5, "widths": (100, 2.5)},
+    }
+    data = {"name": "W", "sheets": [{"name": "S", "tables": [table]}], "metadata": {}}
+
+    assert cli._dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+    assert len(calls) == 1
+
+    # Floats orjson formats differently are found inside tuples too
+    table["metadata"]["widths"] = (100, float("nan"))
+    assert cli._dumps([table]) == json.dumps([table], indent=2, ensure_ascii=False)
+    assert len(calls) == 1
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Optional
 
 import pytest
-from md_spreadsheet_parser import ConversionSchema, parse_table
+from md_spreadsheet_parser import ConversionSchema, TableValidationError, parse_table
 
 
 @dataclass
@@ -242,3 +242,36 @@ def test_advanced_custom_types() -> None:
     assert config.theme_color.r == 255
     assert config.theme_color.g == 0
     assert config.theme_color.b == 0
+
+
+def test_boolean_pairs_not_shared_between_calls() -> None:
+    """
+    Converters reused across calls must still follow each call's schema.
+    """
+    markdown = """
+| Name | Is Active | Score |
+| --- | --- | --- |
+| Tanaka | Hai | 100 |
+"""
+    table = parse_table(markdown)
+    japanese = ConversionSchema(boolean_pairs=(("hai", "iie"),))
+
+    assert table.to_models(User, conversion_schema=japanese)[0].is_active is True
+    with pytest.raises(TableValidationError):
+        table.to_models(User)
+    assert table.to_models(User, conversion_schema=japanese)[0].is_active is True
+
+
+def test_unhashable_annotation_reports_validation_error() -> None:
+    """
+    Field types that cannot be hashed fail per cell, not with a raw TypeError.
+    """
+
+    @dataclass
+    class Parcel:
+        weight: Annotated[str, {"unit": "kg"}]
+
+    table = parse_table("| Weight |\n| --- |\n| 5 |")
+
+    with pytest.raises(TableValidationError, match="Column 'weight'"):
+        table.to_models(Parcel)
@@ -622,3 +622,30 @@ Notes.
         assert len(workbook.sheets) == 1
         assert workbook.metadata is not None
         assert workbook.metadata.get("custom") == "data"
+
+    def test_metadata_comment_skips_h1_in_code_block(self):
+        """An H1 inside a code block between the workbook H1 and the metadata is ignored."""
+        markdown = """# Intro
+
+Intro text.
+
+# Data
+
+## Sheet1
+
+```markdown
+# Not A Header
+```
+
+| A |
+| - |
+| 1 |
+
+<!-- md-spreadsheet-workbook-metadata: {} -->
+
+# Appendix
+"""
+        workbook = parse_workbook(markdown)
+        assert workbook.name == "Data"
+        assert len(workbook.sheets) == 1
+        assert workbook.sheets[0].name == "Sheet1"
@@ -1,3 +1,8 @@
+import json
+from dataclasses import asdict, astuple
+
+import pytest
+
 from md_spreadsheet_parser.parsing import parse_workbook
 
 
@@ -146,9 +151,10 @@ custom:
 # ==========================================
 
 
-def test_frontmatter_roundtrip_basic():
-    """Basic round-trip: to_markdown() reproduces the original text."""
-    original = (
+# Each case must come back from to_markdown() unchanged.
+ROUNDTRIP_CASES = [
+    # Basic round-trip
+    pytest.param(
         "---\n"
         "title: My Workbook\n"
         "description: A test workbook\n"
@@ -159,15 +165,11 @@ def test_frontmatter_roundtrip_basic():
         "\n"
         "| Col A | Col B |\n"
         "| --- | --- |\n"
-        "| 1 | 2 |"
-    )
-    wb = parse_workbook(original)
-    assert wb.to_markdown() == original
-
-
-def test_frontmatter_roundtrip_preserves_format():
-    """to_markdown() preserves frontmatter format (no H1 + comment conversion)."""
-    original = (
+        "| 1 | 2 |",
+        id="basic",
+    ),
+    # Frontmatter format is preserved (no H1 + comment conversion)
+    pytest.param(
         "---\n"
         "title: Frontmatter Book\n"
         "author: Jane\n"
@@ -177,15 +179,11 @@ def test_frontmatter_roundtrip_preserves_format():
         "\n"
         "| X |\n"
         "| --- |\n"
-        "| y |"
-    )
-    wb = parse_workbook(original)
-    assert wb.to_markdown() == original
-
-
-def test_frontmatter_roundtrip_with_metadata_comment_coexistence():
-    """Frontmatter + comment metadata both survive the round-trip."""
-    original = (
+        "| y |",
+        id="preserves_format",
+    ),
+    # Frontmatter + comment metadata both survive
+    pytest.param(
         "---\n"
         "title: Mixed Book\n"
         "author: frontmatter_author\n"
@@ -197,15 +195,11 @@ def test_frontmatter_roundtrip_with_metadata_comment_coexistence():
         "| --- |\n"
         "| 1 |\n"
         "\n"
-        '<!-- md-spreadsheet-workbook-metadata: {"guiData": 42, "author": "comment_author"} -->'
-    )
-    wb = parse_workbook(original)
-    assert wb.to_markdown() == original
-
-
-def test_frontmatter_roundtrip_dendron_style():
-    """Dendron-style daily note with quoted strings, large ints, and lists."""
-    original = (
+        '<!-- md-spreadsheet-workbook-metadata: {"guiData": 42, "author": "comment_author"} -->',
+        id="metadata_comment_coexistence",
+    ),
+    # Dendron-style daily note with quoted strings, large ints, and lists
+    pytest.param(
         "---\n"
         'title: "2026-02-25"\n'
         "desc: Daily note for today\n"
@@ -220,8 +214,15 @@ def test_frontmatter_roundtrip_dendron_style():
         "\n"
         "| Task | Status |\n"
         "| --- | --- |\n"
-        "| Buy milk | pending |"
-    )
+        "| Buy milk | pending |",
+        id="dendron_style",
+    ),
+]
+
+
+@pytest.mark.parametrize("original", ROUNDTRIP_CASES)
+def test_frontmatter_roundtrip(original):
+    """to_markdown() reproduces the original text."""
     wb = parse_workbook(original)
     assert wb.to_markdown() == original
 
@@ -254,10 +255,10 @@ title: Compact
     assert "|---|---|" not in result
 
 
-def test_frontmatter_yaml_comments_lost_on_roundtrip():
-    """YAML comments inside frontmatter are stripped (accepted behavior).
+def test_frontmatter_yaml_comments_preserved_on_roundtrip():
+    """Unchanged frontmatter is written back verbatim, comments included.
 
-    Inline comments and commented-out list items do not survive round-trip.
+    The separator row is still normalized by the generator.
     """
     original_with_comments = """\
 ---
@@ -276,14 +277,14 @@ tags:
 """
     wb = parse_workbook(original_with_comments)
 
-    # Comments are stripped, separator is normalized
     expected = (
         "---\n"
         "title: Commented Book\n"
-        "author: Jane\n"
-        "status: draft\n"
+        "author: Jane # Lead author\n"
+        "status: draft # Will change to published\n"
         "tags:\n"
         "  - fiction\n"
+        "  # - non-fiction  (commented out)\n"
         "  - novel\n"
         "---\n"
         "\n"
@@ -294,3 +295,71 @@ tags:
         "| 1 |"
     )
     assert wb.to_markdown() == expected
+
+
+def test_frontmatter_regenerated_after_change():
+    """Once the frontmatter data changes, it is serialized from the data."""
+    original = """\
+---
+title: Commented Book
+author: Jane # Lead author
+---
+## Chapter
+| A |
+| --- |
+| 1 |
+"""
+    wb = parse_workbook(original)
+    assert wb.metadata is not None
+    wb.metadata["frontmatter"]["author"] = "John"
+
+    assert wb.to_markdown().startswith(
+        "---\ntitle: Commented Book\nauthor: John\n---\n\n## Chapter"
+    )
+
+
+def test_frontmatter_regenerated_after_type_change():
+    """Changing a value to an equal value of another type is still a change."""
+    original = """\
+---
+title: Typed Book
+draft: 1
+ratio: 2
+---
+## Chapter
+| A |
+| --- |
+| 1 |
+"""
+    wb = parse_workbook(original)
+    assert wb.metadata is not None
+    wb.metadata["frontmatter"]["draft"] = True
+    wb.metadata["frontmatter"]["ratio"] = 2.0
+
+    reparsed = parse_workbook(wb.to_markdown())
+    assert reparsed.metadata is not None
+    assert reparsed.metadata["frontmatter"] == {
+        "title": "Typed Book",
+        "draft": True,
+        "ratio": 2.0,
+    }
+    assert reparsed.metadata["frontmatter"]["draft"] is True
+    assert isinstance(reparsed.metadata["frontmatter"]["ratio"], float)
+
+
+def test_frontmatter_source_not_in_json():
+    wb = parse_workbook(
+        "---\ntitle: Book # comment\n---\n## Sheet\n| A |\n| - |\n| 1 |"
+    )
+
+    assert "comment" not in json.dumps(wb.json)
+    assert wb.json["metadata"]["frontmatter"] == {"title": "Book"}
+
+
+def test_frontmatter_workbook_supports_asdict():
+    md = "---\ntitle: Book # comment\n---\n## Sheet\n| A |\n| - |\n| 1 |"
+    wb = parse_workbook(md)
+
+    data = asdict(wb)
+    assert data["metadata"]["frontmatter"] == {"title": "Book"}
+    assert astuple(wb)[1] == "Book"
@@ -159,3 +159,51 @@ Some description.
     assert len(workbook.sheets) == 2
     assert workbook.sheets[0].name == "Sheet 1"
     assert workbook.sheets[1].name == "Sheet 2"
+
+
+# Pathological inputs: very long runs of a single character. None of the
+# regexes or scanners used while parsing may backtrack on these, so each
+# parse finishes in linear time.
+LONG = 20000
+
+
+def test_very_long_separator_row():
+    markdown = "| A |\n|:" + "-" * LONG + ":|\n| 1 |"
+    table = parse_table(markdown)
+    assert table.headers == ["A"]
+    assert table.alignments == ["center"]
+    assert table.rows == [["1"]]
+
+
+def test_very_long_header_marker_run():
+    markdown = "# Tables\n\n## Sheet\n\n" + "#" * LONG + " x\n| A |\n| - |\n| 1 |"
+    workbook = parse_workbook(markdown)
+    assert workbook.name == "Tables"
+    assert [sheet.name for sheet in workbook.sheets] == ["Sheet"]
+    assert workbook.sheets[0].tables[0].rows == [["1"]]
+
+
+def test_unterminated_frontmatter():
+    markdown = "---\n" + "key: value\n" * LONG
+    workbook = parse_workbook(markdown)
+    assert workbook.sheets == []
+
+
+def test_unterminated_metadata_comment():
+    markdown = (
+        "# Tables\n## Sheet\n| A |\n| - |\n| 1 |\n"
+        "<!-- md-spreadsheet-table-metadata: " + " " * LONG
+    )
+    table = parse_workbook(markdown).sheets[0].tables[0]
+    assert table.rows[0] == ["1"]
+    assert table.metadata is not None
+    assert "visual" not in table.metadata
+
+
+def test_long_runs_inside_cells():
+    backticks = "`" * LONG
+    backslashes = "\\" * LONG
+    br_tags = "<br " * LONG
+    for cell in (backticks, backslashes, br_tags.strip()):
+        table = parse_table(f"| A |\n| - |\n| {cell} |")
+        assert len(table.rows) == 1
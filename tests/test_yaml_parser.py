@@ -21,6 +21,24 @@ def test_extract_frontmatter():
     assert remaining == "# Heading"
 
 
+def test_extract_frontmatter_delimiter_edge_cases():
+    # Closing delimiter at the very end of the document
+    assert extract_frontmatter("---\ntitle: a\n---") == ("title: a", "")
+    # Unterminated block: no frontmatter at all
+    assert extract_frontmatter("---\ntitle: a\n# Heading") == (
+        None,
+        "---\ntitle: a\n# Heading",
+    )
+    # "----" and "--- x" do not close the block
+    assert extract_frontmatter("---\na: 1\n----\nb: 2\n---\nrest") == (
+        "a: 1\n----\nb: 2",
+        "rest",
+    )
+    assert extract_frontmatter("---\na: 1\n--- x\n") == (None, "---\na: 1\n--- x\n")
+    # A later closing line takes precedence over an immediately closed block
+    assert extract_frontmatter("---\n---\nb: 2\n---\nrest") == ("---\nb: 2", "rest")
+
+
 def test_parse_yaml_frontmatter_scalars():
     yaml_text = """
     string1: value
@@ -122,3 +140,35 @@ def test_parse_yaml_frontmatter_mixed():
         "summary": "A great book.\nRead it now.",
         "published": True,
     }
+
+
+def test_parse_yaml_frontmatter_flat_and_nested_agree():
+    # Flat frontmatter takes a fast path; adding a comment or a list
+    # switches to the full parser, which must yield the same values.
+    flat = "title: Daily\nupdated: 1708851375000\nratio: 0.5\ndraft: false"
+    expected = {
+        "title": "Daily",
+        "updated": 1708851375000,
+        "ratio": 0.5,
+        "draft": False,
+    }
+    assert parse_yaml_frontmatter(flat) == expected
+    assert parse_yaml_frontmatter(flat + "\n# trailing comment") == expected
+    assert parse_yaml_frontmatter(flat + "\ntags:\n  - a") == {
+        **expected,
+        "tags": ["a"],
+    }
+
+
+def test_parse_yaml_frontmatter_returns_independent_results():
+    # Results are memoized; mutating one must not leak into the next call.
+    yaml_text = "title: Shared\ntags:\n  - a\ncustom:\n  mood: 5"
+    first = parse_yaml_frontmatter(yaml_text)
+    first["tags"].append("b")
+    first["custom"]["mood"] = 1
+
+    assert parse_yaml_frontmatter(yaml_text) == {
+        "title": "Shared",
+        "tags": ["a"],
+        "custom": {"mood": 5},
+    }